@@ -1,7 +1,8 @@
 """Support for power & energy sensors for VeSync outlets."""
 
-from functools import cached_property
+from functools import partial
 import logging
+from operator import attrgetter
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
@@ -10,11 +11,15 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .common import VeSyncBaseEntity, has_feature
+from .common import VeSyncBaseEntity, VeSyncDiscoveryBatcher, has_feature
 from .const import BINARY_SENSOR_TYPES_AIRFRYER, DOMAIN, VS_BINARY_SENSORS, VS_DISCOVERY
 
 _LOGGER = logging.getLogger(__name__)
 
+_AIRFRYER_SENSOR_TYPES = tuple(BINARY_SENSOR_TYPES_AIRFRYER.values())
+
+_DISCOVERY_SIGNAL = VS_DISCOVERY.format(VS_BINARY_SENSORS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -25,14 +30,18 @@ async def async_setup_entry(
 
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
-    @callback
-    def discover(devices):
-        """Add new devices to platform."""
-        _setup_entities(devices, async_add_entities, coordinator)
-
+    batcher = VeSyncDiscoveryBatcher(
+        hass,
+        partial(
+            _setup_entities,
+            async_add_entities=async_add_entities,
+            coordinator=coordinator,
+        ),
+    )
     config_entry.async_on_unload(
-        async_dispatcher_connect(hass, VS_DISCOVERY.format(VS_BINARY_SENSORS), discover)
+        async_dispatcher_connect(hass, _DISCOVERY_SIGNAL, batcher.async_discover)
     )
+    config_entry.async_on_unload(batcher.async_cancel)
 
     _setup_entities(
         hass.data[DOMAIN][config_entry.entry_id][VS_BINARY_SENSORS],
@@ -47,14 +56,10 @@ def _setup_entities(devices, async_add_entities, coordinator):
     entities = []
     for dev in devices:
         if hasattr(dev, "fryer_status"):
-            for stype in BINARY_SENSOR_TYPES_AIRFRYER.values():
-                entities.append(  # noqa: PERF401
-                    VeSyncairfryerSensor(
-                        dev,
-                        coordinator,
-                        stype,
-                    )
-                )
+            entities.extend(
+                VeSyncairfryerSensor(dev, coordinator, stype)
+                for stype in _AIRFRYER_SENSOR_TYPES
+            )
         if has_feature(dev, "details", "water_lacks"):
             entities.append(VeSyncOutOfWaterSensor(dev, coordinator))
         if has_feature(dev, "details", "water_tank_lifted"):
@@ -62,71 +67,51 @@ def _setup_entities(devices, async_add_entities, coordinator):
         if has_feature(dev, "details", "filter_open_state"):
             entities.append(VeSyncFilterOpenStateSensor(dev, coordinator))
 
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
 
 class VeSyncairfryerSensor(VeSyncBaseEntity, BinarySensorEntity):
     """Class representing a VeSyncairfryerSensor."""
 
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
     def __init__(self, airfryer, coordinator, stype) -> None:
         """Initialize the VeSync humidifier device."""
         super().__init__(airfryer, coordinator)
         self.airfryer = airfryer
-        self.stype = stype
-
-    @cached_property
-    def entity_category(self):
-        """Return the diagnostic entity category."""
-        return EntityCategory.DIAGNOSTIC
-
-    @cached_property
-    def unique_id(self):
-        """Return unique ID for water tank lifted sensor on device."""
-        return f"{super().unique_id}-" + self.stype[0]
-
-    @cached_property
-    def name(self):
-        """Return sensor name."""
-        return self.stype[1]
+        key, self._attr_name, self._attr_icon = stype
+        self._attr_unique_id = f"{self.base_unique_id}-{key}"
+        self._get_state = attrgetter(key)
 
     @property
     def is_on(self) -> bool:
         """Return a value indicating whether the Humidifier's water tank is lifted."""
-        return getattr(self.airfryer, self.stype[0], False)
+        try:
+            return bool(self._get_state(self.airfryer))
+        except AttributeError:
+            return False
         # return self.smarthumidifier.details["water_tank_lifted"]
 
-    @cached_property
-    def icon(self):
-        """Return the icon to use in the frontend, if any."""
-        return self.stype[2]
-
 
 class VeSyncBinarySensorEntity(VeSyncBaseEntity, BinarySensorEntity):
     """Representation of a binary sensor describing diagnostics of a VeSync humidifier."""
 
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
     def __init__(self, humidifier, coordinator) -> None:
         """Initialize the VeSync humidifier device."""
         super().__init__(humidifier, coordinator)
         self.smarthumidifier = humidifier
 
-    @cached_property
-    def entity_category(self):
-        """Return the diagnostic entity category."""
-        return EntityCategory.DIAGNOSTIC
-
 
 class VeSyncOutOfWaterSensor(VeSyncBinarySensorEntity):
     """Out of Water Sensor."""
 
-    @cached_property
-    def unique_id(self):
-        """Return unique ID for out of water sensor on device."""
-        return f"{super().unique_id}-out_of_water"
-
-    @cached_property
-    def name(self):
-        """Return sensor name."""
-        return f"{super().name} out of water"
+    def __init__(self, humidifier, coordinator) -> None:
+        """Initialize the out of water sensor."""
+        super().__init__(humidifier, coordinator)
+        self._attr_unique_id = f"{self.base_unique_id}-out_of_water"
+        self._attr_name = f"{self.base_name} out of water"
 
     @property
     def is_on(self) -> bool:
@@ -137,15 +122,11 @@ class VeSyncOutOfWaterSensor(VeSyncBinarySensorEntity):
 class VeSyncWaterTankLiftedSensor(VeSyncBinarySensorEntity):
     """Tank Lifted Sensor."""
 
-    @cached_property
-    def unique_id(self):
-        """Return unique ID for water tank lifted sensor on device."""
-        return f"{super().unique_id}-water_tank_lifted"
-
-    @cached_property
-    def name(self):
-        """Return sensor name."""
-        return f"{super().name} water tank lifted"
+    def __init__(self, humidifier, coordinator) -> None:
+        """Initialize the water tank lifted sensor."""
+        super().__init__(humidifier, coordinator)
+        self._attr_unique_id = f"{self.base_unique_id}-water_tank_lifted"
+        self._attr_name = f"{self.base_name} water tank lifted"
 
     @property
     def is_on(self) -> bool:
@@ -156,15 +137,11 @@ class VeSyncWaterTankLiftedSensor(VeSyncBinarySensorEntity):
 class VeSyncFilterOpenStateSensor(VeSyncBinarySensorEntity):
     """Filter Open Sensor."""
 
-    @cached_property
-    def unique_id(self):
-        """Return unique ID for filter open state sensor on device."""
-        return f"{super().unique_id}-filter-open-state"
-
-    @cached_property
-    def name(self):
-        """Return sensor name."""
-        return f"{super().name} filter open state"
+    def __init__(self, humidifier, coordinator) -> None:
+        """Initialize the filter open state sensor."""
+        super().__init__(humidifier, coordinator)
+        self._attr_unique_id = f"{self.base_unique_id}-filter-open-state"
+        self._attr_name = f"{self.base_name} filter open state"
 
     @property
     def is_on(self) -> bool:
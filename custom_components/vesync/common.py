@@ -1,8 +1,9 @@
 """Common utilities for VeSync Component."""
-from functools import cached_property
+import asyncio
 import logging
 
 from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity, ToggleEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -14,6 +15,7 @@ from .const import (
     VS_AIRFRYER_TYPES,
     VS_BINARY_SENSORS,
     VS_BUTTON,
+    VS_DISCOVERY_DELAY,
     VS_FAN_TYPES,
     VS_FANS,
     VS_HUMIDIFIERS,
@@ -27,11 +29,75 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+class lockless_cached_property:  # noqa: N801
+    """Cache a property value on the instance without locking.
+
+    Unlike functools.cached_property on older Python versions, no lock is taken.
+    Getters may still run from executor threads (e.g. humidifier set_mode), so
+    they must be idempotent: concurrent first reads compute the same value and
+    the last write wins.
+    """
+
+    def __init__(self, func) -> None:
+        """Wrap the getter."""
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        """Store the attribute name the value is cached under."""
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        """Compute the value once and store it on the instance."""
+        if obj is None:
+            return self
+        value = obj.__dict__[self.name] = self.func(obj)
+        return value
+
+
 def has_feature(device, dictionary, attribute):
     """Return the detail of the attribute."""
     return getattr(device, dictionary, {}).get(attribute, None) is not None
 
 
+class VeSyncDiscoveryBatcher:
+    """Coalesce bursts of discovered devices into one entity setup call."""
+
+    def __init__(self, hass: HomeAssistant, setup_entities) -> None:
+        """Initialize the batcher with the platform's setup callback."""
+        self._hass = hass
+        self._setup_entities = setup_entities
+        self._pending = {}
+        self._handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_discover(self, devices):
+        """Queue newly discovered devices and schedule a flush."""
+        for dev in devices:
+            self._pending.setdefault((dev.cid, dev.sub_device_no), dev)
+        if self._handle is None:
+            self._handle = self._hass.loop.call_later(
+                VS_DISCOVERY_DELAY, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self):
+        """Set up entities for every device queued since the last flush."""
+        self._handle = None
+        devices = list(self._pending.values())
+        self._pending.clear()
+        self._setup_entities(devices)
+
+    @callback
+    def async_cancel(self):
+        """Drop queued devices and cancel any scheduled flush."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._pending.clear()
+
+
 async def async_process_devices(hass, manager):
     """Assign devices to proper component."""
     devices = {
@@ -129,6 +195,10 @@ class VeSyncBaseEntity(CoordinatorEntity, Entity):
         """Initialize the VeSync device."""
         self.device = device
         super().__init__(coordinator, context=device)
+        # The unique_id may be overridden in subclasses, such as in sensors. Maintaining base_unique_id allows
+        # us to group related entities under a single device.
+        self._attr_unique_id = self.base_unique_id
+        self._attr_name = self.base_name
 
     @property
     def base_unique_id(self):
@@ -137,29 +207,17 @@ class VeSyncBaseEntity(CoordinatorEntity, Entity):
             return f"{self.device.cid}{str(self.device.sub_device_no)}"
         return self.device.cid
 
-    @cached_property
-    def unique_id(self):
-        """Return the ID of this device."""
-        # The unique_id property may be overridden in subclasses, such as in sensors. Maintaining base_unique_id allows
-        # us to group related entities under a single device.
-        return self.base_unique_id
-
-    @cached_property
+    @lockless_cached_property
     def base_name(self):
         """Return the name of the device."""
         return self.device.device_name
 
-    @cached_property
-    def name(self):
-        """Return the name of the entity (may be overridden)."""
-        return self.base_name
-
     @property
     def available(self) -> bool:
         """Return True if device is available."""
         return self.device.connection_status == "online"
 
-    @cached_property
+    @lockless_cached_property
     def device_info(self) -> DeviceInfo | None:
         """Return device information."""
         return {
@@ -5,6 +5,8 @@ from homeassistant.const import UnitOfTemperature, UnitOfTime
 
 DOMAIN = "vesync"
 VS_DISCOVERY = "vesync_discovery_{}"
+# Seconds to coalesce discovery signals before adding entities
+VS_DISCOVERY_DELAY = 0.1
 SERVICE_UPDATE_DEVS = "update_devices"
 
 VS_BUTTON = "button"
@@ -1,10 +1,10 @@
 """Support for VeSync humidifiers."""
 from __future__ import annotations
 
-from functools import cached_property
 import logging
 from collections.abc import Mapping
-from typing import Any
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.humidifier import HumidifierEntity
 from homeassistant.components.humidifier.const import (
@@ -15,11 +15,12 @@ from homeassistant.components.humidifier.const import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pyvesync.vesyncfan import VeSyncHumid200300S, VeSyncSuperior6000S
 
-from .common import VeSyncDevice
+from .common import VeSyncDevice, VeSyncDiscoveryBatcher, lockless_cached_property
 from .const import (
     DOMAIN,
     VS_DISCOVERY,
@@ -33,6 +34,8 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_DISCOVERY_SIGNAL = VS_DISCOVERY.format(VS_HUMIDIFIERS)
+
 
 MAX_HUMIDITY = 80
 MIN_HUMIDITY = 30
@@ -47,6 +50,14 @@ VS_TO_HA_MODE_MAP = {
 
 HA_TO_VS_MODE_MAP = {v: k for k, v in VS_TO_HA_MODE_MAP.items()}
 
+_VS_TO_HA_MODE_GET = VS_TO_HA_MODE_MAP.get
+_HA_TO_VS_MODE_GET = HA_TO_VS_MODE_MAP.get
+
+# Available HA modes shared by every humidifier reporting the same mist modes.
+# The lists are shared across entities and must not be mutated.
+_MODES_CACHE: dict[tuple[str, ...], list[str]] = {}
+_EMPTY_MODES: list[str] = []
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -57,14 +68,18 @@ async def async_setup_entry(
 
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
-    @callback
-    def discover(devices):
-        """Add new devices to platform."""
-        _setup_entities(devices, async_add_entities, coordinator)
-
+    batcher = VeSyncDiscoveryBatcher(
+        hass,
+        partial(
+            _setup_entities,
+            async_add_entities=async_add_entities,
+            coordinator=coordinator,
+        ),
+    )
     config_entry.async_on_unload(
-        async_dispatcher_connect(hass, VS_DISCOVERY.format(VS_HUMIDIFIERS), discover)
+        async_dispatcher_connect(hass, _DISCOVERY_SIGNAL, batcher.async_discover)
     )
+    config_entry.async_on_unload(batcher.async_cancel)
 
     _setup_entities(
         hass.data[DOMAIN][config_entry.entry_id][VS_HUMIDIFIERS],
@@ -76,103 +91,113 @@ async def async_setup_entry(
 @callback
 def _setup_entities(devices, async_add_entities, coordinator):
     """Check if device is online and add entity."""
-    async_add_entities(
-        [VeSyncHumidifierHA(dev, coordinator) for dev in devices],
-        update_before_add=True,
-    )
+    async_add_entities([VeSyncHumidifierHA(dev, coordinator) for dev in devices])
 
 
 def _get_ha_mode(vs_mode: str) -> str | None:
-    ha_mode = VS_TO_HA_MODE_MAP.get(vs_mode)
+    ha_mode = _VS_TO_HA_MODE_GET(vs_mode)
     if ha_mode is None:
         _LOGGER.warning("Unknown mode '%s'", vs_mode)
     return ha_mode
 
 
 def _get_vs_mode(ha_mode: str) -> str | None:
-    vs_mode = HA_TO_VS_MODE_MAP.get(ha_mode)
+    vs_mode = _HA_TO_VS_MODE_GET(ha_mode)
     if vs_mode is None:
         _LOGGER.warning("Unknown mode '%s'", ha_mode)
     return vs_mode
 
 
-VeSyncHumidifier = VeSyncHumid200300S | VeSyncSuperior6000S
+_SUPPORTED_HUMIDIFIERS = (VeSyncHumid200300S, VeSyncSuperior6000S)
+
+_INCOMPATIBLE_HUMIDIFIER = (
+    "This humidifier is not compatible with the current release of CustomVeSync"
+)
+
+if TYPE_CHECKING:
+    VeSyncHumidifier = VeSyncHumid200300S | VeSyncSuperior6000S
+
+
+class IncompatibleHumidifierError(HomeAssistantError):
+    """Error to indicate a humidifier model is not supported."""
+
 
 class VeSyncHumidifierHA(VeSyncDevice, HumidifierEntity):
     """Representation of a VeSync humidifier."""
 
     _attr_max_humidity = MAX_HUMIDITY
     _attr_min_humidity = MIN_HUMIDITY
+    _attr_supported_features = HumidifierEntityFeature.MODES
 
     def __init__(self, humidifier: VeSyncHumidifier, coordinator) -> None:
         """Initialize the VeSync humidifier device."""
         super().__init__(humidifier, coordinator)
 
-        if not isinstance(humidifier, VeSyncHumidifier):
-            _LOGGER.error("Found incompatible humidifier model")
-            raise Exception(
-                "This humidifier is not compatible with the current release of CustomVeSync"
+        if not isinstance(humidifier, _SUPPORTED_HUMIDIFIERS):
+            _LOGGER.error(
+                "Found incompatible humidifier model %s", type(humidifier).__name__
             )
+            raise IncompatibleHumidifierError(_INCOMPATIBLE_HUMIDIFIER)
 
-        self.smarthumidifier = humidifier
+        self._dev = humidifier
+        self.unique_info = humidifier.uuid
 
-    @cached_property
+        # The Superior 6000S reports state in different fields; pick the
+        # accessors once instead of checking the model on every read.
+        if type(humidifier) is VeSyncSuperior6000S:
+            self._get_target_humidity = lambda: humidifier.details["target_humidity"]
+            self._get_device_mode = lambda: humidifier.mode
+            self._get_is_on = lambda: humidifier.device_status == "on"
+        else:
+            self._get_target_humidity = lambda: humidifier.config[
+                "auto_target_humidity"
+            ]
+            self._get_device_mode = lambda: humidifier.details["mode"]
+            # device_status is always on
+            self._get_is_on = lambda: humidifier.enabled
+
+    @lockless_cached_property
     def available_modes(self) -> list[str]:
         """Return the available mist modes."""
-        if self.smarthumidifier.mist_modes is None:
-            return []
-
-        modes: list[str] = []
-        for vs_mode in self.smarthumidifier.mist_modes:
-            ha_mode = _get_ha_mode(vs_mode)
-
-            if ha_mode is None:
-                continue
-
-            modes.append(ha_mode)
-
+        if self._dev.mist_modes is None:
+            return _EMPTY_MODES
+
+        key = tuple(self._dev.mist_modes)
+        modes = _MODES_CACHE.get(key)
+        if modes is None:
+            modes = _MODES_CACHE[key] = [
+                ha_mode
+                for ha_mode in (_get_ha_mode(vs_mode) for vs_mode in key)
+                if ha_mode is not None
+            ]
         return modes
 
-    @cached_property
-    def supported_features(self):
-        """Flag supported features."""
-        return HumidifierEntityFeature.MODES
-
     @property
     def target_humidity(self) -> int:
         """Return the humidity we try to reach."""
-        if type(self.smarthumidifier) is VeSyncSuperior6000S:
-            return self.smarthumidifier.details["target_humidity"]
-        return self.smarthumidifier.config["auto_target_humidity"]
+        return self._get_target_humidity()
 
     @property
     def mode(self) -> str | None:
         """Get the current preset mode."""
-        if type(self.smarthumidifier) is VeSyncSuperior6000S:
-            return _get_ha_mode(self.smarthumidifier.mode)
-        return _get_ha_mode(self.smarthumidifier.details["mode"])
+        return _get_ha_mode(self._get_device_mode())
 
     @property
     def is_on(self) -> bool:
         """Return True if humidifier is on."""
-        if type(self.smarthumidifier) is VeSyncSuperior6000S:
-            return self.smarthumidifier.device_status == "on"
-        return self.smarthumidifier.enabled  # device_status is always on
-
-    @cached_property
-    def unique_info(self) -> str:
-        """Return the ID of this humidifier."""
-        return self.smarthumidifier.uuid
+        return self._get_is_on()
 
     @property
     def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return the state attributes of the humidifier."""
 
+        state_attributes = self.state_attributes
         attr = {}
-        for k, v in self.smarthumidifier.details.items():
-            if k in VS_TO_HA_ATTRIBUTES:
-                attr[VS_TO_HA_ATTRIBUTES[k]] = v
-            elif k in self.state_attributes:
+        for k, v in self._dev.details.items():
+            ha_key = VS_TO_HA_ATTRIBUTES.get(k)
+            if ha_key is not None:
+                attr[ha_key] = v
+            elif k in state_attributes:
                 attr[f"vs_{k}"] = v
             else:
                 attr[k] = v
@@ -180,11 +205,11 @@ class VeSyncHumidifierHA(VeSyncDevice, HumidifierEntity):
 
     def set_humidity(self, humidity: int) -> None:
         """Set the target humidity of the device."""
-        if humidity not in range(self.min_humidity, self.max_humidity + 1):
+        if not MIN_HUMIDITY <= humidity <= MAX_HUMIDITY:
             raise ValueError(
-                "{humidity} is not between {self.min_humidity} and {self.max_humidity} (inclusive)"
+                f"{humidity} is not between {MIN_HUMIDITY} and {MAX_HUMIDITY} (inclusive)"
             )
-        if self.smarthumidifier.set_humidity(humidity):
+        if self._dev.set_humidity(humidity):
             self.schedule_update_ha_state()
         else:
             raise ValueError("An error occurred while setting humidity.")
@@ -193,9 +218,9 @@ class VeSyncHumidifierHA(VeSyncDevice, HumidifierEntity):
         """Set the mode of the device."""
         if mode not in self.available_modes:
             raise ValueError(
-                "{mode} is not one of the valid available modes: {self.available_modes}"
+                f"{mode} is not one of the valid available modes: {self.available_modes}"
             )
-        if self.smarthumidifier.set_humidity_mode(_get_vs_mode(mode)):
+        if self._dev.set_humidity_mode(_get_vs_mode(mode)):
             self.schedule_update_ha_state()
         else:
             raise ValueError("An error occurred while setting mode.")
@@ -205,12 +230,12 @@ class VeSyncHumidifierHA(VeSyncDevice, HumidifierEntity):
         **kwargs,
     ) -> None:
         """Turn the device on."""
-        success = self.smarthumidifier.turn_on()
+        success = self._dev.turn_on()
         if not success:
             raise ValueError("An error occurred while turning on.")
 
     def turn_off(self, **kwargs) -> None:
         """Turn the device off."""
-        success = self.smarthumidifier.turn_off()
+        success = self._dev.turn_off()
         if not success:
             raise ValueError("An error occurred while turning off.")